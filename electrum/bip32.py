@@ -142,15 +142,10 @@ class BIP32Node(NamedTuple):
         child_number = xkey[9:13]
         chaincode = xkey[13:13 + 32]
         header = int.from_bytes(xkey[0:4], byteorder='big')
-        if header in net.XPRV_HEADERS_INV:
-            headers_inv = net.XPRV_HEADERS_INV
-            is_private = True
-        elif header in net.XPUB_HEADERS_INV:
-            headers_inv = net.XPUB_HEADERS_INV
-            is_private = False
-        else:
-            raise InvalidMasterKeyVersionBytes(f'Invalid extended key format: {hex(header)}')
-        xtype = headers_inv[header]
+        try:
+            xtype, is_private = net.ALL_HEADERS_INV[header]
+        except KeyError:
+            raise InvalidMasterKeyVersionBytes(f'Invalid extended key format: {hex(header)}') from None
         if not allow_custom_headers and xtype != "standard":
             raise ValueError(f"only standard xpub/xprv allowed. found custom xtype={xtype}")
         if is_private:
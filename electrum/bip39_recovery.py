@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 import itertools
 
 from . import bitcoin
-from .constants import BIP39_WALLET_FORMATS
+from . import constants
 from .bip32 import BIP32_PRIME, BIP32Node
 from .bip32 import convert_bip32_strpath_to_intpath as bip32_str_to_ints
 from .bip32 import convert_bip32_intpath_to_strpath as bip32_ints_to_str
@@ -19,7 +19,7 @@ if TYPE_CHECKING:
 async def account_discovery(network: 'Network', get_account_xpub):
     async with OldTaskGroup() as group:
         account_scan_tasks = []
-        for wallet_format in BIP39_WALLET_FORMATS:
+        for wallet_format in constants.bip39_wallet_formats():
             account_scan = scan_for_active_accounts(network, get_account_xpub, wallet_format)
             account_scan_tasks.append(await group.spawn(account_scan))
     active_accounts = []
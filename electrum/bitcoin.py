@@ -381,7 +381,11 @@ def hash_decode(x: str) -> bytes:
 ############ functions from pywallet #####################
 
 def hash160_to_b58_address(h160: bytes, addrtype: int) -> str:
-    s = bytes([addrtype]) + h160
+    return _hash160_to_b58_address(h160, bytes([addrtype]))
+
+
+def _hash160_to_b58_address(h160: bytes, addrtype_bytes: bytes) -> str:
+    s = addrtype_bytes + h160
     s = s + sha256d(s)[0:4]
     return base_encode(s, base=58)
 
@@ -396,11 +400,11 @@ def b58_address_to_hash160(addr: str) -> Tuple[int, bytes]:
 
 def hash160_to_p2pkh(h160: bytes, *, net=None) -> str:
     if net is None: net = constants.net
-    return hash160_to_b58_address(h160, net.ADDRTYPE_P2PKH)
+    return _hash160_to_b58_address(h160, net.ADDRTYPE_P2PKH_B)
 
 def hash160_to_p2sh(h160: bytes, *, net=None) -> str:
     if net is None: net = constants.net
-    return hash160_to_b58_address(h160, net.ADDRTYPE_P2SH)
+    return _hash160_to_b58_address(h160, net.ADDRTYPE_P2SH_B)
 
 def public_key_to_p2pkh(public_key: bytes, *, net=None) -> str:
     return hash160_to_p2pkh(hash_160(public_key), net=net)
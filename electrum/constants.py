@@ -24,30 +24,82 @@
 # SOFTWARE.
 
 import os
+import sys
 import json
+import functools
 
-from typing import NamedTuple, Union
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Mapping, Tuple, Union
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Can't import from util due to circular
 def inv_dict(d):
-    return {v: k for k, v in d.items()}
+    return dict(zip(d.values(), d.keys()))
 
 def read_json(filename, default):
-    path = os.path.join(os.path.dirname(__file__), filename)
+    path = os.path.join(_DIR, filename)
     try:
-        with open(path, 'r') as f:
+        # Note: stdlib json is used on purpose; orjson/ujson can't parse the
+        #       256-bit targets in the checkpoint files.
+        with open(path, 'rb') as f:
             r = json.loads(f.read())
-    except:
+    except (FileNotFoundError, json.JSONDecodeError):
         r = default
     return r
 
 
+def _checkpoint(cp) -> tuple:
+    h, t = cp
+    assert isinstance(h, str) and len(h) == 64, h
+    assert isinstance(t, int), t
+    return h, t
+
+def _legacy_checkpoints_from_json(raw) -> tuple:
+    """Validates and converts a list of [hash, target] pairs to nested tuples."""
+    return tuple(_checkpoint(cp) for cp in raw)
+
+def _dgw_checkpoints_from_json(raw) -> tuple:
+    """Validates and converts a list of [[first_hash, target], [last_hash, target]]
+    chunk checkpoints to nested tuples."""
+    return tuple((_checkpoint(first), _checkpoint(last)) for first, last in raw)
+
+
+class _LazyJSON:
+    """Class attribute that is only read from a bundled json file on first access."""
+
+    def __init__(self, filename, default, *, converter=None):
+        self.filename = filename
+        self.default = default
+        self.converter = converter
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        value = read_json(self.filename, self.default)
+        if self.converter is not None:
+            value = self.converter(value)
+        # replace ourselves on the class, so later lookups are plain attribute reads
+        setattr(owner, self.name, value)
+        return value
+
+
 GIT_REPO_URL = "https://github.com/AIPowerGrid/electrum-aipg"
 GIT_REPO_ISSUES_URL = "https://github.com/AIPowerGrid/electrum-aipg/issues"
-BIP39_WALLET_FORMATS = read_json('bip39_wallet_formats.json', [])
+_ASSET_PREFIX = b'aipg'  # shared by all nets
+
 
+@functools.lru_cache(maxsize=None)
+def bip39_wallet_formats():
+    # only needed for bip39 account discovery, so don't parse it at import
+    return read_json('bip39_wallet_formats.json', [])
 
-class BurnAmounts(NamedTuple):
+
+@dataclass(frozen=True)
+class BurnAmounts:
     IssueAssetBurnAmount: Union[int, float]
     ReissueAssetBurnAmount: Union[int, float]
     IssueSubAssetBurnAmount: Union[int, float]
@@ -59,7 +111,22 @@ class BurnAmounts(NamedTuple):
     AddNullQualifierTagBurnAmount: Union[int, float]
 
 
-class BurnAddresses(NamedTuple):
+# same for all nets
+_DEFAULT_BURN_AMOUNTS = BurnAmounts(
+    IssueAssetBurnAmount=50,
+    ReissueAssetBurnAmount=10,
+    IssueSubAssetBurnAmount=10,
+    IssueUniqueAssetBurnAmount=0.5,
+    IssueMsgChannelAssetBurnAmount=10,
+    IssueQualifierAssetBurnAmount=100,
+    IssueSubQualifierAssetBurnAmount=10,
+    IssueRestrictedAssetBurnAmount=150,
+    AddNullQualifierTagBurnAmount=0.01
+)
+
+
+@dataclass(frozen=True)
+class BurnAddresses:
     IssueAssetBurnAddress: str
     ReissueAssetBurnAddress: str
     IssueSubAssetBurnAddress: str
@@ -71,7 +138,19 @@ class BurnAddresses(NamedTuple):
     AddNullQualifierTagBurnAddress: str
     GlobalBurnAddress: str
 
+    def __post_init__(self):
+        # intern the addresses, and keep them in a set for 'addr in BURN_ADDRESSES' checks
+        for f in fields(self):
+            object.__setattr__(self, f.name, sys.intern(getattr(self, f.name)))
+        object.__setattr__(self, '_addresses', frozenset(getattr(self, f.name) for f in fields(self)))
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._addresses
+
+
 class AbstractNet:
+    __slots__ = ()  # nets are only used as classes, never instantiated
+
     GENESIS = None
     CHECKPOINTS = None
     DGW_CHECKPOINTS = None
@@ -84,29 +163,45 @@ class AbstractNet:
     WIF_PREFIX: int
     ADDRTYPE_P2PKH: int
     ADDRTYPE_P2SH: int
+    ADDRTYPE_P2PKH_B: bytes  # set for all nets in NETS_LIST at import
+    ADDRTYPE_P2SH_B: bytes  # set for all nets in NETS_LIST at import
     SEGWIT_HRP: str
     BOLT11_HRP: str
     GENESIS: str
     BLOCK_HEIGHT_FIRST_LIGHTNING_CHANNELS: int = 0
     BIP44_COIN_TYPE: int
     LN_REALM_BYTE: int
+    MAX_LEGACY_CHECKPOINT: int
+    MAX_CHECKPOINT: int
+    REV_GENESIS_BYTES: bytes  # set for all nets in NETS_LIST at import
+    ALL_HEADERS_INV: Mapping[int, Tuple[str, bool]]  # header -> (xtype, is_private); set at import
 
+    # The checkpoint heights are computed on first use (and then stored on the class),
+    # as computing them requires the lazily loaded checkpoint files.
     @classmethod
     def max_legacy_checkpoint(cls) -> int:
-        return max(0, len(cls.CHECKPOINTS) * 2016 - 1)
+        max_cp = cls.__dict__.get('MAX_LEGACY_CHECKPOINT')
+        if max_cp is None:
+            max_cp = max(0, len(cls.CHECKPOINTS) * 2016 - 1)
+            cls.MAX_LEGACY_CHECKPOINT = max_cp
+        return max_cp
 
     @classmethod
     def max_checkpoint(cls) -> int:
-        # DGW Checkpoints start at height 0 and are every 2016 blocks after
-        return max(0, cls.DGW_CHECKPOINTS_START + (len(cls.DGW_CHECKPOINTS) * cls.DGW_CHECKPOINTS_SPACING) - 1)
+        max_cp = cls.__dict__.get('MAX_CHECKPOINT')
+        if max_cp is None:
+            # DGW Checkpoints start at height 0 and are every 2016 blocks after
+            max_cp = max(0, cls.DGW_CHECKPOINTS_START + (len(cls.DGW_CHECKPOINTS) * cls.DGW_CHECKPOINTS_SPACING) - 1)
+            cls.MAX_CHECKPOINT = max_cp
+        return max_cp
 
     @classmethod
     def rev_genesis_bytes(cls) -> bytes:
-        from . import bitcoin
-        return bytes.fromhex(bitcoin.rev_hex(cls.GENESIS))
+        return cls.REV_GENESIS_BYTES
 
 
 class AIPGMainnet(AbstractNet):
+    __slots__ = ()
     NET_NAME = "mainnet"
     TESTNET = False
     WIF_PREFIX = 128
@@ -119,8 +214,8 @@ class AIPGMainnet(AbstractNet):
     GENESIS = "000000fe8c99a7aacc5aff074278a8378e625c0d02e4894db8f09bab185f4eb6"
     DEFAULT_PORTS = {'t': '50001', 's': '50002'}
     DEFAULT_SERVERS = read_json('servers.json', {})
-    CHECKPOINTS = read_json('checkpoints_dwg.json', [])
-    DGW_CHECKPOINTS = read_json('checkpoints_dgw.json', [])
+    CHECKPOINTS = _LazyJSON('checkpoints_dwg.json', [], converter=_legacy_checkpoints_from_json)
+    DGW_CHECKPOINTS = _LazyJSON('checkpoints_dgw.json', [], converter=_dgw_checkpoints_from_json)
     DGW_CHECKPOINTS_SPACING = 2016
     DGW_CHECKPOINTS_START = 0 * DGW_CHECKPOINTS_SPACING
 
@@ -130,57 +225,48 @@ class AIPGMainnet(AbstractNet):
     nDGWActivationBlock = 1
 
     DEFAULT_MESSAGE_CHANNELS = ['ELECTRUM_AIPG~notification']
-    ASSET_PREFIX = b'aipg'
+    ASSET_PREFIX = _ASSET_PREFIX
     SHORT_NAME = 'AIPG'
     LONG_NAME = 'AIPG'
 
     MULTISIG_ASSETS = False
 
-    XPRV_HEADERS = {
+    XPRV_HEADERS = MappingProxyType({
         'standard': 0x0488ade4,  # xprv
         'p2wpkh-p2sh': 0x049d7878,  # yprv
         'p2wsh-p2sh': 0x0295b005,  # Yprv
         'p2wpkh': 0x04b2430c,  # zprv
         'p2wsh': 0x02aa7a99,  # Zprv
-    }
-    XPRV_HEADERS_INV = inv_dict(XPRV_HEADERS)
-    XPUB_HEADERS = {
+    })
+    XPRV_HEADERS_INV = MappingProxyType(inv_dict(XPRV_HEADERS))
+    XPUB_HEADERS = MappingProxyType({
         'standard': 0x0488b21e,  # xpub
         'p2wpkh-p2sh': 0x049d7cb2,  # ypub
         'p2wsh-p2sh': 0x0295b43f,  # Ypub
         'p2wpkh': 0x04b24746,  # zpub
         'p2wsh': 0x02aa7ed3,  # Zpub
-    }
-    XPUB_HEADERS_INV = inv_dict(XPUB_HEADERS)
+    })
+    XPUB_HEADERS_INV = MappingProxyType(inv_dict(XPUB_HEADERS))
     BIP44_COIN_TYPE = 2686
 
-    BURN_AMOUNTS = BurnAmounts(
-        IssueAssetBurnAmount=50,
-        ReissueAssetBurnAmount=10,
-        IssueSubAssetBurnAmount=10,
-        IssueUniqueAssetBurnAmount=0.5,
-        IssueMsgChannelAssetBurnAmount=10,
-        IssueQualifierAssetBurnAmount=100,
-        IssueSubQualifierAssetBurnAmount=10,
-        IssueRestrictedAssetBurnAmount=150,
-        AddNullQualifierTagBurnAmount=0.01
-    )
+    BURN_AMOUNTS = _DEFAULT_BURN_AMOUNTS
 
     BURN_ADDRESSES = BurnAddresses(
-        IssueAssetBurnAddress='AIissueAssetXXXXXXXXXXXXXXXXXhhZGt',
-        ReissueAssetBurnAddress='AIReissueAssetXXXXXXXXXXXXXXVEFAWu',
-        IssueSubAssetBurnAddress='AIissueSubAssetXXXXXXXXXXXXXWcwhwL',
-        IssueUniqueAssetBurnAddress='AIissueUniqueAssetXXXXXXXXXXWEAe58',
-        IssueMsgChannelAssetBurnAddress='AIissueMsgChanneLAssetXXXXXXSjHvAY',
-        IssueQualifierAssetBurnAddress='AIissueQuaLifierXXXXXXXXXXXXUgEDbC',
-        IssueSubQualifierAssetBurnAddress='AIissueSubQuaLifierXXXXXXXXXVTzvv5',
-        IssueRestrictedAssetBurnAddress='AIissueRestrictedXXXXXXXXXXXXzJZ1q',
-        AddNullQualifierTagBurnAddress='AIaddTagBurnXXXXXXXXXXXXXXXXZQm5ya',
-        GlobalBurnAddress='AIBurnXXXXXXXXXXXXXXXXXXXXXXWUo9FV'
+        'AIissueAssetXXXXXXXXXXXXXXXXXhhZGt',  # IssueAssetBurnAddress
+        'AIReissueAssetXXXXXXXXXXXXXXVEFAWu',  # ReissueAssetBurnAddress
+        'AIissueSubAssetXXXXXXXXXXXXXWcwhwL',  # IssueSubAssetBurnAddress
+        'AIissueUniqueAssetXXXXXXXXXXWEAe58',  # IssueUniqueAssetBurnAddress
+        'AIissueMsgChanneLAssetXXXXXXSjHvAY',  # IssueMsgChannelAssetBurnAddress
+        'AIissueQuaLifierXXXXXXXXXXXXUgEDbC',  # IssueQualifierAssetBurnAddress
+        'AIissueSubQuaLifierXXXXXXXXXVTzvv5',  # IssueSubQualifierAssetBurnAddress
+        'AIissueRestrictedXXXXXXXXXXXXzJZ1q',  # IssueRestrictedAssetBurnAddress
+        'AIaddTagBurnXXXXXXXXXXXXXXXXZQm5ya',  # AddNullQualifierTagBurnAddress
+        'AIBurnXXXXXXXXXXXXXXXXXXXXXXWUo9FV'  # GlobalBurnAddress
     )
 
 
 class AIPGTestnet(AbstractNet):
+    __slots__ = ()
     NET_NAME = "testnet"
     BIP44_COIN_TYPE = 1
     LN_REALM_BYTE = 0
@@ -197,8 +283,8 @@ class AIPGTestnet(AbstractNet):
     GENESIS = "000000f798386703ae778eeaf8a2f426dc2715eb8989b4226cddc1681b567760"
     DEFAULT_PORTS = {'t': '51001', 's': '51002'}
     DEFAULT_SERVERS = read_json('servers_testnet.json', {})
-    CHECKPOINTS = []
-    DGW_CHECKPOINTS = read_json('checkpoints_dgw_testnet.json', [])
+    CHECKPOINTS = ()
+    DGW_CHECKPOINTS = _LazyJSON('checkpoints_dgw_testnet.json', [], converter=_dgw_checkpoints_from_json)
     DGW_CHECKPOINTS_SPACING = 2016
     DGW_CHECKPOINTS_START = 0
 
@@ -208,63 +294,68 @@ class AIPGTestnet(AbstractNet):
     nDGWActivationBlock = 1
 
     DEFAULT_MESSAGE_CHANNELS = []
-    ASSET_PREFIX = b'aipg'
+    ASSET_PREFIX = _ASSET_PREFIX
     SHORT_NAME = 'tAIPG'
     LONG_NAME = 'AIPG'
     MULTISIG_ASSETS = False
     
-    XPRV_HEADERS = {
+    XPRV_HEADERS = MappingProxyType({
         'standard': 0x04358394,  # tprv
         'p2wpkh-p2sh': 0x044a4e28,  # uprv
         'p2wsh-p2sh': 0x024285b5,  # Uprv
         'p2wpkh': 0x045f18bc,  # vprv
         'p2wsh': 0x02575048,  # Vprv
-    }
-    XPRV_HEADERS_INV = inv_dict(XPRV_HEADERS)
-    XPUB_HEADERS = {
+    })
+    XPRV_HEADERS_INV = MappingProxyType(inv_dict(XPRV_HEADERS))
+    XPUB_HEADERS = MappingProxyType({
         'standard': 0x043587cf,  # tpub
         'p2wpkh-p2sh': 0x044a5262,  # upub
         'p2wsh-p2sh': 0x024289ef,  # Upub
         'p2wpkh': 0x045f1cf6,  # vpub
         'p2wsh': 0x02575483,  # Vpub
-    }
-    XPUB_HEADERS_INV = inv_dict(XPUB_HEADERS)
-
-    BURN_AMOUNTS = BurnAmounts(
-        IssueAssetBurnAmount=50,
-        ReissueAssetBurnAmount=10,
-        IssueSubAssetBurnAmount=10,
-        IssueUniqueAssetBurnAmount=0.5,
-        IssueMsgChannelAssetBurnAmount=10,
-        IssueQualifierAssetBurnAmount=100,
-        IssueSubQualifierAssetBurnAmount=10,
-        IssueRestrictedAssetBurnAmount=150,
-        AddNullQualifierTagBurnAmount=0.01
-    )
+    })
+    XPUB_HEADERS_INV = MappingProxyType(inv_dict(XPUB_HEADERS))
+
+    BURN_AMOUNTS = _DEFAULT_BURN_AMOUNTS
 
     BURN_ADDRESSES = BurnAddresses(
-        IssueAssetBurnAddress='n1issueAssetXXXXXXXXXXXXXXXXWdnemQ',
-        ReissueAssetBurnAddress='n1ReissueAssetXXXXXXXXXXXXXXWG9NLd',
-        IssueSubAssetBurnAddress='n1issueSubAssetXXXXXXXXXXXXXbNiH6v',
-        IssueUniqueAssetBurnAddress='n1issueUniqueAssetXXXXXXXXXXS4695i',
-        IssueMsgChannelAssetBurnAddress='n1issueMsgChanneLAssetXXXXXXT2PBdD',
-        IssueQualifierAssetBurnAddress='n1issueQuaLifierXXXXXXXXXXXXUysLTj',
-        IssueSubQualifierAssetBurnAddress='n1issueSubQuaLifierXXXXXXXXXYffPLh',
-        IssueRestrictedAssetBurnAddress='n1issueRestrictedXXXXXXXXXXXXZVT9V',
-        AddNullQualifierTagBurnAddress='n1addTagBurnXXXXXXXXXXXXXXXXX5oLMH',
-        GlobalBurnAddress='AcYHNBj8C6nCFSpu1ANsJxturWp31W32cd'
+        'n1issueAssetXXXXXXXXXXXXXXXXWdnemQ',  # IssueAssetBurnAddress
+        'n1ReissueAssetXXXXXXXXXXXXXXWG9NLd',  # ReissueAssetBurnAddress
+        'n1issueSubAssetXXXXXXXXXXXXXbNiH6v',  # IssueSubAssetBurnAddress
+        'n1issueUniqueAssetXXXXXXXXXXS4695i',  # IssueUniqueAssetBurnAddress
+        'n1issueMsgChanneLAssetXXXXXXT2PBdD',  # IssueMsgChannelAssetBurnAddress
+        'n1issueQuaLifierXXXXXXXXXXXXUysLTj',  # IssueQualifierAssetBurnAddress
+        'n1issueSubQuaLifierXXXXXXXXXYffPLh',  # IssueSubQualifierAssetBurnAddress
+        'n1issueRestrictedXXXXXXXXXXXXZVT9V',  # IssueRestrictedAssetBurnAddress
+        'n1addTagBurnXXXXXXXXXXXXXXXXX5oLMH',  # AddNullQualifierTagBurnAddress
+        'AcYHNBj8C6nCFSpu1ANsJxturWp31W32cd'  # GlobalBurnAddress
     )
 
 
 def all_subclasses(cls):
     """Return all (transitive) subclasses of cls."""
-    res = set(cls.__subclasses__())
-    for sub in res.copy():
-        res |= all_subclasses(sub)
+    res = set()
+    stack = list(cls.__subclasses__())
+    while stack:
+        sub = stack.pop()
+        if sub in res:
+            continue
+        res.add(sub)
+        stack.extend(sub.__subclasses__())
     return res
 
 NETS_LIST = tuple(all_subclasses(AbstractNet))
 
+for _net in NETS_LIST:
+    _net.REV_GENESIS_BYTES = bytes.fromhex(_net.GENESIS)[::-1]
+    _net.ADDRTYPE_P2PKH_B = bytes([_net.ADDRTYPE_P2PKH])
+    _net.ADDRTYPE_P2SH_B = bytes([_net.ADDRTYPE_P2SH])
+    _net.ALL_HEADERS_INV = MappingProxyType({
+        **{header: (xtype, True) for xtype, header in _net.XPRV_HEADERS.items()},
+        **{header: (xtype, False) for xtype, header in _net.XPUB_HEADERS.items()},
+    })
+del _net
+
 # don't import net directly, import the module instead (so that net is singleton)
 net = AIPGMainnet
 